@@ -13,6 +13,7 @@
 from __future__ import absolute_import, division, print_function
 
 import copy
+import os
 import re
 from os.path import join
 
@@ -191,6 +192,75 @@ class TestMaps(object):
         assert map_ratio.ivar == pytest.approx(map_arith.ivar, nan_ok=True)
         assert map_ratio.mask == pytest.approx(map_arith.mask, nan_ok=True)
 
+    def test_get_unbinned(self, galaxy):
+        maps = Maps(plateifu=galaxy.plateifu, release=galaxy.release, bintype=galaxy.bintype.name)
+        unbinned = maps.get_unbinned()
+
+        if not maps.is_binned():
+            assert unbinned is maps
+        else:
+            assert unbinned.is_binned() is False
+            assert maps.get_unbinned() is unbinned
+            assert unbinned.get_unbinned() is unbinned
+
+    def test_wcs_cache_returns_copies(self, galaxy):
+        maps1 = Maps(filename=galaxy.mapspath)
+        maps2 = Maps(filename=galaxy.mapspath)
+
+        assert maps1.wcs is not maps2.wcs
+        assert maps1.wcs.wcs.compare(maps2.wcs.wcs)
+
+        crval = maps2.wcs.wcs.crval.copy()
+        maps1.wcs.wcs.crval = crval + 1.
+        assert maps2.wcs.wcs.crval == pytest.approx(crval)
+
+        maps3 = Maps(filename=galaxy.mapspath)
+        assert maps3.wcs.wcs.crval == pytest.approx(crval)
+
+    def test_path_params_reset_on_file_load(self, galaxy):
+        maps = Maps(filename=galaxy.mapspath)
+
+        # Simulates path parameters cached from a bintype and template that
+        # do not match the file header.
+        maps._path_params = {'path_type': 'mangadap5', 'daptype': 'stale'}
+        maps._load_maps_from_file(data=maps.data)
+
+        params = maps._getPathParams()
+        if maps.release == 'MPL-4':
+            assert params['bintype'] == maps.bintype.name
+        else:
+            assert params['daptype'] == '{0}-{1}'.format(maps.bintype.name, maps.template.name)
+
+        assert os.path.basename(maps._getFullPath()) == os.path.basename(galaxy.mapspath)
+
+    def test_save_after_get_unbinned(self, galaxy, temp_scratch):
+        maps = Maps(filename=galaxy.mapspath)
+        maps.get_unbinned()
+
+        maps_file = temp_scratch.join('test_maps_unbinned.mpf')
+        maps.save(str(maps_file))
+        assert maps_file.check() is True
+
+        maps_restored = Maps.restore(str(maps_file))
+        assert maps_restored._unbinned is None
+        assert maps_restored.get_unbinned().is_binned() is False
+
+    def test_restore_without_cached_attributes(self, galaxy, temp_scratch):
+        maps = Maps(filename=galaxy.mapspath)
+
+        # Simulates a Maps pickled before these attributes were added.
+        for attr in ['_unbinned', '_path_params', '_property_index']:
+            maps.__dict__.pop(attr)
+
+        maps_file = temp_scratch.join('test_maps.mpf')
+        maps.save(str(maps_file))
+
+        maps_restored = Maps.restore(str(maps_file))
+        assert maps_restored._unbinned is None
+        assert maps_restored._path_params is None
+        assert maps_restored.getMap('emline_gflux', channel='ha_6564') is not None
+        assert maps_restored._property_index is not None
+
 
 class TestMaskbit(object):
 
@@ -127,6 +127,18 @@ class TestModelCube(object):
         model_cube = ModelCube(plateifu=galaxy.plateifu, mode='remote')
         assert isinstance(model_cube.getMaps(), Maps)
 
+    def test_get_unbinned(self, galaxy):
+        model_cube = ModelCube(plateifu=galaxy.plateifu, release=galaxy.release,
+                               bintype=galaxy.bintype.name)
+        unbinned = model_cube.get_unbinned()
+
+        if not model_cube.is_binned():
+            assert unbinned is model_cube
+        else:
+            assert isinstance(unbinned, ModelCube)
+            assert unbinned.is_binned() is False
+            assert unbinned.template == model_cube.template
+
     def test_nobintype_in_db(self, galaxy):
 
         if galaxy.release != 'MPL-6':
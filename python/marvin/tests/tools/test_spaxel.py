@@ -287,6 +287,21 @@ class TestBinInfo(object):
             sp_bin = maps[sp.y, sp.x]
             assert sp_bin.stellar_vel.bin.binid == spaxel.stellar_vel.bin.binid
 
+    def test_from_coords(self):
+
+        maps = Maps(plateifu='8485-1901', release='MPL-6', bintype='HYB10')
+        spaxels = Spaxel.from_coords([14, 15, 16], [22, 22, 23], maps=maps,
+                                     cube=False, modelcube=False)
+
+        assert len(spaxels) == 3
+        assert [(sp.x, sp.y) for sp in spaxels] == [(14, 22), (15, 22), (16, 23)]
+        assert all(sp.loaded is False for sp in spaxels)
+        assert spaxels[1].maps_quantities is not spaxels[0].maps_quantities
+
+        spaxels[1].load()
+        assert spaxels[1].stellar_vel.value == maps[22, 15].stellar_vel.value
+        assert spaxels[0].loaded is False
+
     def test_hasbin(self):
         maps = Maps(plateifu='8485-1901', release='MPL-6', bintype='HYB10')
         spaxel = maps[22, 14]
@@ -15,7 +15,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from marvin.utils.general.maskbit import Maskbit
+from marvin.utils.general.maskbit import Maskbit, get_manga_target
 
 
 bits = [(0, 'BITZERO', 'The zeroth bit.'),
@@ -179,3 +179,22 @@ class TestMaskbit(object):
         mb.mask = mask
         actual = mb.get_mask(labels, mask=custom_mask, dtype=dtype)
         assert (actual == expected).all()
+
+
+class TestGetMangaTarget(object):
+
+    @pytest.mark.parametrize('header, expected',
+                             [({'MNGTRG1': 1024}, 1024),
+                              ({'MNGTARG1': 2048}, 2048)])
+    def test_get_manga_target(self, header, expected):
+        bitmasks = {'MANGA_TARGET1': Maskbit(name='MANGA_TARGET1')}
+        manga_target = get_manga_target('1', bitmasks, header)
+        assert manga_target.mask == expected
+        assert bitmasks['MANGA_TARGET1'].mask is None
+
+    def test_get_manga_target_no_aliasing(self):
+        bitmasks = {'MANGA_TARGET1': Maskbit(name='MANGA_TARGET1')}
+        target_a = get_manga_target('1', bitmasks, {'MNGTRG1': 1024})
+        target_b = get_manga_target('1', bitmasks, {'MNGTRG1': 2048})
+        assert target_a.mask == 1024
+        assert target_b.mask == 2048
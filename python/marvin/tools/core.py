@@ -11,6 +11,7 @@
 from __future__ import absolute_import, division, print_function
 
 import abc
+import copy
 import warnings
 
 import astropy.io.fits
@@ -244,7 +245,7 @@ class MarvinToolsClass(MMAMixIn):
             return None
 
         try:
-            dapqual = self._bitmasks['MANGA_' + self.datamodel.qual_flag]
+            dapqual = copy.copy(self._bitmasks['MANGA_' + self.datamodel.qual_flag])
         except KeyError:
             warnings.warn('cannot find bitmask MANGA_{!r}'.format(self.datamodel.qual_flag))
             dapqual = None
@@ -271,7 +272,7 @@ class MarvinToolsClass(MMAMixIn):
     @property
     def target_flags(self):
         """Bundle MaNGA targeting flags."""
-        return [self.manga_target1, self.manga_target2, self.manga_target3]
+        return [get_manga_target(flag_id, self._bitmasks, self.header) for flag_id in '123']
 
     def getImage(self):
         ''' Retrieves the Image :class:`~marvin.tools.image.Image` for this object '''
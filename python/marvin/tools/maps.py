@@ -12,16 +12,16 @@
 
 from __future__ import absolute_import, division, print_function
 
-import copy
 import inspect
+import os
 import warnings
+from collections import OrderedDict
 
 import astropy.io.fits
 import astropy.wcs
 import numpy as np
 import pandas as pd
 import six
-from pkg_resources import parse_version
 
 import marvin
 import marvin.api.api
@@ -50,6 +50,77 @@ except ImportError:
 __all__ = ['Maps']
 
 
+def _get_cached(cache, key, build, maxsize):
+    """Returns ``cache[key]``, calling ``build()`` to fill it on a miss.
+
+    ``cache`` is an `~collections.OrderedDict`. Once it holds ``maxsize``
+    entries, the oldest one is dropped to make room for the new one.
+
+    """
+
+    # Other threads may evict entries at any time, so the cache is read only once
+    # and the value returned is always the local one.
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+
+    value = build()
+
+    if len(cache) >= maxsize:
+        try:
+            cache.popitem(last=False)
+        except KeyError:
+            # Another thread emptied the cache first.
+            pass
+
+    cache[key] = value
+
+    return value
+
+
+# Caches the headers parsed from the strings returned by the API.
+_header_cache = OrderedDict()
+_HEADER_CACHE_SIZE = 256
+
+
+def _header_from_string(header_string):
+    """Returns a copy of the cached FITS header for a header string."""
+
+    header = _get_cached(_header_cache, header_string,
+                         lambda: astropy.io.fits.Header.fromstring(header_string),
+                         _HEADER_CACHE_SIZE)
+
+    # Returns a copy so that changes to an instance header do not modify the cache.
+    return header.copy()
+
+
+# Caches the WCS for a Maps, so that loading several Maps for the same
+# target does not rerun WCSLIB every time.
+_wcs_cache = OrderedDict()
+_WCS_CACHE_SIZE = 128
+
+
+def _cached_wcs(key, get_header, naxis=None):
+    """Returns a copy of the cached WCS for ``key``.
+
+    ``get_header`` is only called, to build the WCS, if ``key`` is not in the
+    cache. If ``key`` is ``None`` the WCS is built but not cached. If ``naxis``
+    is set, only the first ``naxis`` axes are kept.
+
+    """
+
+    if key is None:
+        return astropy.wcs.WCS(get_header(), naxis=naxis)
+
+    wcs = _get_cached(_wcs_cache, (key, naxis),
+                      lambda: astropy.wcs.WCS(get_header(), naxis=naxis),
+                      _WCS_CACHE_SIZE)
+
+    # Returns a copy so that changes to an instance WCS do not modify the cache.
+    return wcs.deepcopy()
+
+
 class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
     """A class that represents a DAP MAPS file.
 
@@ -93,6 +164,9 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
         self.template = template
 
         self._bitmasks = None
+        self._unbinned = None
+        self._path_params = None
+        self._property_index = None
 
         MarvinToolsClass.__init__(self, input=input, filename=filename,
                                   mangaid=mangaid, plateifu=plateifu,
@@ -157,11 +231,30 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
         self.template = self.datamodel.parent.get_template(self.template)
 
     def __deepcopy__(self, memo):
-        return Maps(plateifu=copy.deepcopy(self.plateifu, memo),
-                    release=copy.deepcopy(self.release, memo),
-                    bintype=copy.deepcopy(self.bintype, memo),
-                    template=copy.deepcopy(self.template, memo),
-                    nsa_source=copy.deepcopy(self.nsa_source, memo))
+        # The strings are immutable and bintype and template are resolved again
+        # from the datamodel by the new instance, so there is nothing to deepcopy.
+        return Maps(plateifu=self.plateifu,
+                    release=self.release,
+                    bintype=self.bintype,
+                    template=self.template,
+                    nsa_source=self.nsa_source)
+
+    def __getstate__(self):
+
+        odict = super(Maps, self).__getstate__()
+
+        # The unbinned Maps is only a cache and may come from the DB, so it is not pickled.
+        odict['_unbinned'] = None
+
+        return odict
+
+    def __setstate__(self, idict):
+
+        # Maps pickled before these cached attributes were added do not include them.
+        for attr in ['_unbinned', '_path_params', '_property_index']:
+            idict.setdefault(attr, None)
+
+        super(Maps, self).__setstate__(idict)
 
     @staticmethod
     def _check_versions(instance):
@@ -220,28 +313,35 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
 
         """
 
-        plate, ifu = self.plateifu.split('-')
+        if self._path_params is None:
 
-        if self.release == 'MPL-4':
-            niter = int('{0}{1}'.format(self.template.n, self.bintype.n))
-            params = dict(drpver=self._drpver, dapver=self._dapver,
-                          plate=plate, ifu=ifu, bintype=self.bintype.name,
-                          n=niter, path_type='mangamap')
-        else:
-            daptype = '{0}-{1}'.format(self.bintype.name, self.template.name)
-            params = dict(drpver=self._drpver, dapver=self._dapver,
-                          plate=plate, ifu=ifu, mode='MAPS', daptype=daptype,
-                          path_type='mangadap5')
+            plate, ifu = self.plateifu.split('-')
+
+            if self.release == 'MPL-4':
+                niter = int('{0}{1}'.format(self.template.n, self.bintype.n))
+                self._path_params = dict(drpver=self._drpver, dapver=self._dapver,
+                                         plate=plate, ifu=ifu, bintype=self.bintype.name,
+                                         n=niter, path_type='mangamap')
+            else:
+                daptype = '{0}-{1}'.format(self.bintype.name, self.template.name)
+                self._path_params = dict(drpver=self._drpver, dapver=self._dapver,
+                                         plate=plate, ifu=ifu, mode='MAPS', daptype=daptype,
+                                         path_type='mangadap5')
 
-        return params
+        # Returns a copy because callers pop path_type from it.
+        return dict(self._path_params)
 
     def _load_maps_from_file(self, data=None):
         """Loads a MAPS file."""
 
+        # The WCS is only cached when we open the file ourselves, keyed on its path and mtime.
+        wcs_key = None
+
         if data is not None:
             assert isinstance(data, astropy.io.fits.HDUList), 'data is not a HDUList.'
         else:
             self.data = astropy.io.fits.open(self.filename)
+            wcs_key = ('file', os.path.realpath(self.filename), os.path.getmtime(self.filename))
 
         self.header = self.data[0].header
 
@@ -252,11 +352,9 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
 
         # We use EMLINE_GFLUX because is present in MPL-4 and 5 and is not expected to go away.
         header = self.data['EMLINE_GFLUX'].header
-        naxis = header['NAXIS']
-        wcs_pre = astropy.wcs.WCS(header)
 
         # Takes only the first two axis.
-        self.wcs = wcs_pre.sub(2) if naxis > 2 else naxis
+        self.wcs = _cached_wcs(wcs_key, lambda: header, naxis=2)
 
         self._shape = (header['NAXIS2'], header['NAXIS1'])
 
@@ -285,7 +383,6 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
             header_bintype = self.data[0].header['BINTYPE'].strip().upper()
 
         # Checks the template from the header
-        #is_MPL8 = parse_version(self._dapver) >= parse_version(datamodel['MPL-8'].release)
         is_MPL8 = check_versions(self._dapver, datamodel['MPL-8'].release)
         header_template_key = 'TPLKEY' if is_MPL4 else 'DAPTYPE' if is_MPL8 else 'SCKEY'
         if is_MPL8:
@@ -300,6 +397,9 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
         if self.template.name != header_template:
             self.template = self.datamodel.parent.get_template(header_template)
 
+        # The release, bintype, or template may have changed, so the path is recomputed.
+        self._path_params = None
+
     def _load_maps_from_db(self, data=None):
         """Loads the ``mangadap.File`` object for this Maps."""
 
@@ -325,24 +425,23 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
 
             datadb = mdb.datadb
             dapdb = mdb.dapdb
-            # Initial query for version
-            version_query = mdb.session.query(dapdb.File).join(
-                datadb.PipelineInfo,
-                datadb.PipelineVersion).filter(
-                    datadb.PipelineVersion.version == self._dapver).from_self()
-
-            # Query for maps parameters
-            db_maps_file = version_query.join(
-                datadb.Cube,
-                datadb.IFUDesign).filter(
-                    datadb.Cube.plate == plate,
-                    datadb.IFUDesign.name == str(ifu)).from_self().join(
-                        dapdb.FileType).filter(dapdb.FileType.value == 'MAPS').join(
-                            dapdb.Structure, dapdb.BinType).join(
-                                dapdb.Template,
-                                dapdb.Structure.template_kin_pk == dapdb.Template.pk).filter(
+            # Single join over the relationships so that the filters are planned
+            # together instead of through nested from_self() subqueries. The limit
+            # still lets us detect duplicates.
+            db_maps_file = mdb.session.query(dapdb.File).join(
+                dapdb.File.pipelineinfo, datadb.PipelineInfo.version).join(
+                    dapdb.File.cube, datadb.Cube.ifu).join(
+                        dapdb.File.filetype).join(
+                            dapdb.File.structure, dapdb.Structure.bintype).join(
+                                dapdb.Structure.template_kin).filter(
+                                    datadb.PipelineVersion.version == self._dapver,
+                                    datadb.Cube.plate == plate,
+                                    datadb.IFUDesign.name == str(ifu),
+                                    dapdb.FileType.value == 'MAPS',
                                     dapdb.BinType.name == self.bintype.name,
-                                    dapdb.Template.name == self.template.name).all()
+                                    dapdb.Template.name == self.template.name).options(
+                                        sqlalchemy.orm.contains_eager(dapdb.File.cube).joinedload(
+                                            datadb.Cube.wcs)).limit(2).all()
 
             if len(db_maps_file) > 1:
                 raise marvin.core.exceptions.MarvinError(
@@ -362,7 +461,7 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
         self.mangaid = cubehdr['MANGAID'].strip()
 
         # Creates the WCS from the cube's WCS header
-        self.wcs = astropy.wcs.WCS(self.data.cube.wcs.makeHeader())
+        self.wcs = _cached_wcs(('db', self.data.cube.pk), self.data.cube.wcs.makeHeader)
 
         self._shape = self.data.cube.shape.shape
 
@@ -386,13 +485,14 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
         if self.plateifu not in data['plateifu']:
             raise marvin.core.exceptions.MarvinError('remote maps has a different plateifu!')
 
-        self.header = astropy.io.fits.Header.fromstring(data['header'])
+        self.header = _header_from_string(data['header'])
 
         # Sets the mangaid
         self.mangaid = data['mangaid']
 
         # Sets the WCS
-        self.wcs = astropy.wcs.WCS(astropy.io.fits.Header.fromstring(data['wcs']))
+        self.wcs = _cached_wcs(('api', data['wcs']),
+                               lambda: astropy.io.fits.Header.fromstring(data['wcs']))
 
         self._shape = data['shape']
 
@@ -592,7 +692,14 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
         if channel is not None:
             property_name = property_name + '_' + channel
 
-        best = self.datamodel[property_name]
+        # Exact, case-insensitive lookup tried before falling back to fuzzy matching.
+        if self._property_index is None:
+            self._property_index = {prop.full().lower(): prop for prop in self.datamodel}
+
+        best = self._property_index.get(property_name.lower())
+        if best is None:
+            best = self.datamodel[property_name]
+
         assert isinstance(best, Property), 'the retrived value is not a property.'
 
         if exact:
@@ -666,12 +773,16 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
     def get_unbinned(self):
         """Returns a version of ``self`` corresponding to the unbinned Maps."""
 
-        if self.is_binned is False:
+        if not self.is_binned():
             return self
-        else:
-            return Maps(plateifu=self.plateifu, release=self.release,
-                        bintype=self.datamodel.parent.get_unbinned(),
-                        template=self.template, mode=self.mode)
+
+        # Caches the unbinned Maps so that we only load it once.
+        if self._unbinned is None:
+            self._unbinned = Maps(plateifu=self.plateifu, release=self.release,
+                                  bintype=self.datamodel.parent.get_unbinned(),
+                                  template=self.template, mode=self.mode)
+
+        return self._unbinned
 
     def get_bpt(self, method='kewley06', snr_min=3, return_figure=True,
                 show_plot=True, use_oi=True, **kwargs):
@@ -796,15 +907,19 @@ class Maps(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
         allprops = [p.full() for p in self.datamodel]
 
         if columns:
+            columns = set(columns)
             allprops = [p for p in allprops if p in columns]
-        data = np.array([self[p].value[mask].flatten() for p in allprops])
+
+        # one flat array per column, passed to pandas in a single call
+        data = OrderedDict((p, self[p].value[mask].flatten()) for p in allprops)
 
         # add a column for spaxel index
-        spaxarr = np.array([np.where(mask.flatten())[0]]) \
-            if mask is not None else np.array([np.arange(data.shape[1])])
-        data = np.concatenate((spaxarr, data), axis=0)
-        allprops = ['spaxelid'] + allprops
+        if mask is not None:
+            spaxelid = np.where(mask.flatten())[0]
+        else:
+            spaxelid = np.arange(len(next(iter(data.values()))) if data else 0)
 
         # create the dataframe
-        df = pd.DataFrame(data.transpose(), columns=allprops)
+        df = pd.DataFrame(data, columns=allprops)
+        df.insert(0, 'spaxelid', spaxelid)
         return df
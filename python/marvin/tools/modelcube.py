@@ -12,11 +12,9 @@
 
 from __future__ import absolute_import, division, print_function
 
-import distutils
 import warnings
 
 import numpy as np
-from pkg_resources import parse_version
 from astropy.io import fits
 from astropy.wcs import WCS
 
@@ -88,8 +86,7 @@ class ModelCube(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
         NSAMixIn.__init__(self, nsa_source=nsa_source)
 
         # Checks that DAP is at least MPL-5
-        MPL5 = distutils.version.StrictVersion('2.0.2')
-        if self.filename is None and distutils.version.StrictVersion(self._dapver) < MPL5:
+        if self.filename is None and not check_versions(self._dapver, '2.0.2'):
             raise MarvinError('ModelCube requires at least dapver=\'2.0.2\'')
 
         self.header = None
@@ -509,8 +506,7 @@ class ModelCube(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
 
         # Before MPL-6, the modelcube does not include the binid extension,
         # so we need to get the binid map from the associated MAPS.
-        if (distutils.version.StrictVersion(self._dapver) <
-                distutils.version.StrictVersion('2.1')):
+        if not check_versions(self._dapver, '2.1'):
             return self.getMaps().get_binid()
 
         if self.data_origin == 'file':
@@ -675,7 +671,7 @@ class ModelCube(MarvinToolsClass, NSAMixIn, DAPallMixIn, GetApertureMixIn):
     def get_unbinned(self):
         """Returns a version of ``self`` corresponding to the unbinned ModelCube."""
 
-        if not self.is_binned:
+        if not self.is_binned():
             return self
         else:
             return ModelCube(plateifu=self.plateifu, release=self.release,
@@ -43,17 +43,24 @@ class BinInfo(object):
 
         return self._parent.get_binid(self._datamodel)
 
+    def _binid_from_map(self, binid_map):
+        """Returns the binid of this spaxel in ``binid_map``."""
+
+        return int(binid_map[self._spaxel.y, self._spaxel.x].value)
+
     @property
     def binid(self):
         """Returns the binid associated to this quantity and spaxel."""
 
-        return int(self.binid_map[self._spaxel.y, self._spaxel.x].value)
+        return self._binid_from_map(self.binid_map)
 
     @property
     def binid_mask(self):
         """Returns a mask of the spaxels with the same binid."""
 
-        return self.binid_map.value == self.binid
+        binid_map = self.binid_map
+
+        return binid_map.value == self._binid_from_map(binid_map)
 
     @property
     def is_binned(self):
@@ -78,22 +85,24 @@ class BinInfo(object):
 
         """
 
-        if self.binid < 0:
+        # binid_map builds a new Map on each access, so we only retrieve it once.
+        binid_map = self.binid_map
+        binid = self._binid_from_map(binid_map)
+
+        if binid < 0:
             raise marvin.core.exceptions.MarvinError(
                 'coordinates ({}, {}) do not correspond to a valid binid.'.format(self._spaxel.x,
                                                                                   self._spaxel.y))
 
-        spaxel_coords = zip(*numpy.where(self.binid_map.value == self.binid))
-        spaxels = []
+        # (N, 2) array of (y, x) pairs, in the same order as zip(*numpy.where(...))
+        spaxel_coords = numpy.argwhere(binid_map.value == binid)
 
-        for ii, jj in spaxel_coords:
-            spaxels.append(Spaxel(x=jj, y=ii, plateifu=self._spaxel.plateifu,
+        return Spaxel.from_coords(spaxel_coords[:, 1], spaxel_coords[:, 0],
+                                  plateifu=self._spaxel.plateifu,
                                   release=self._spaxel.release, cube=self._spaxel._cube,
                                   maps=self._spaxel._maps, modelcube=self._spaxel._modelcube,
                                   bintype=self._spaxel.bintype, template=self._spaxel.template,
-                                  lazy=lazy))
-
-        return spaxels
+                                  lazy=lazy)
 
 
 class QuantityMixIn(object):
@@ -186,6 +186,58 @@ class Spaxel(object):
         return ('<Marvin Spaxel (plateifu={0.plateifu}, x={0.x:d}, y={0.y:d}; '
                 'x_cen={1:d}, y_cen={2:d}, loaded={3})>'.format(self, x_centre, y_centre, flags))
 
+    @classmethod
+    def from_coords(cls, xs, ys, lazy=True, **kwargs):
+        """Returns a list of spaxels for arrays of coordinates.
+
+        Equivalent to ``[Spaxel(x, y, lazy=lazy, **kwargs) for x, y in
+        zip(xs, ys)]``. For lazy spaxels the metadata resolution, breadcrumb,
+        and VAC lookup are run once, for the first spaxel, and the rest are
+        created from its attributes with only the coordinates and the
+        quantity dictionaries replaced. If ``lazy=False`` each spaxel is
+        instantiated and loaded normally.
+
+        Parameters:
+            xs,ys (array):
+                The `x` and `y` coordinates of the spaxels (0-indexed).
+            lazy (bool):
+                Whether the spaxels are lazy loaded.
+            kwargs (dict):
+                Arguments to be passed to `.Spaxel` (e.g., ``cube``, ``maps``,
+                ``modelcube``, ``plateifu``).
+
+        Returns:
+            spaxels (list):
+                A list of `.Spaxel` instances, one for each coordinate pair.
+
+        """
+
+        xs = np.atleast_1d(xs)
+        ys = np.atleast_1d(ys)
+        assert len(xs) == len(ys), 'xs and ys must have the same size.'
+
+        if len(xs) == 0:
+            return []
+
+        if lazy is False:
+            return [cls(x, y, lazy=False, **kwargs) for x, y in zip(xs, ys)]
+
+        first = cls(xs[0], ys[0], lazy=True, **kwargs)
+        spaxels = [first]
+
+        for x, y in zip(xs[1:], ys[1:]):
+            spaxel = cls.__new__(cls)
+            spaxel.__dict__.update(first.__dict__)
+            spaxel.cube_quantities = FuzzyDict({})
+            spaxel.maps_quantities = FuzzyDict({})
+            spaxel.modelcube_quantities = FuzzyDict({})
+            spaxel._kwargs = first._kwargs.copy()
+            spaxel.x = int(x)
+            spaxel.y = int(y)
+            spaxels.append(spaxel)
+
+        return spaxels
+
     def _check_versions(self, attr):
         """Checks that all input object have the same versions.
 
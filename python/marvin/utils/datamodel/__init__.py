@@ -31,6 +31,9 @@ class DataModelList(six.with_metaclass(MetaDataModel, OrderedDict)):
 
     def __init__(self, models=None):
 
+        # Maps each alias already looked up to its release key.
+        self._alias_lookup = {}
+
         if models is not None:
             assert all([isinstance(model, self.base_model) for model in models]), \
                 'values must be {0} instances.'.format(self.base_name)
@@ -44,6 +47,7 @@ class DataModelList(six.with_metaclass(MetaDataModel, OrderedDict)):
         assert isinstance(value, self.base_model), 'value must be a {0}'.format(self.base_name)
 
         super(DataModelList, self).__setitem__(key, value)
+        self._alias_lookup = {}
 
     def __getitem__(self, release):
         """Returns model based on release and aliases."""
@@ -51,11 +55,15 @@ class DataModelList(six.with_metaclass(MetaDataModel, OrderedDict)):
         if release in self.keys():
             return super(DataModelList, self).__getitem__(release)
 
-        for model in self.values():
-            if release in model.aliases:
-                return model
+        if release not in self._alias_lookup:
+            for key, model in self.items():
+                if release in model.aliases:
+                    self._alias_lookup[release] = key
+                    break
+            else:
+                raise KeyError('cannot find release or alias {0!r}'.format(release))
 
-        raise KeyError('cannot find release or alias {0!r}'.format(release))
+        return super(DataModelList, self).__getitem__(self._alias_lookup[release])
 
     def __contains__(self, value):
         ''' Returns True based on release/aliases using getitem '''
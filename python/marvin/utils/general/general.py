@@ -71,6 +71,9 @@ __all__ = ('convertCoords', 'parseIdentifier', 'mangaid2plateifu', 'findClosestV
 
 drpTable = {}
 
+# Stores the results of check_versions, keyed on the (version1, version2) pair
+_version_checks = {}
+
 
 def validate_jwt(f):
     ''' Decorator to validate a JWT and User '''
@@ -1755,7 +1758,11 @@ def check_versions(version1, version2):
         A boolean indicating if version1 is >= version2
     '''
 
-    return parse_version(version1) >= parse_version(version2)
+    key = (version1, version2)
+    if key not in _version_checks:
+        _version_checks[key] = parse_version(version1) >= parse_version(version2)
+
+    return _version_checks[key]
 
 
 def get_manga_image(cube=None, drpver=None, plate=None, ifu=None, dir3d=None):
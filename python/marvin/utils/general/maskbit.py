@@ -10,6 +10,7 @@
 
 from __future__ import absolute_import, division, print_function
 
+import copy
 import os
 
 import numpy as np
@@ -49,6 +50,11 @@ def get_available_maskbits():
     return sorted(set([it[0] for it in maskbits]))
 
 
+# Header keywords for each MANGA_TARGET flag. Older files use MNGTARG instead of MNGTRG.
+_manga_target_keys = dict((flag_id, ('MNGTRG' + flag_id, 'MNGTARG' + flag_id))
+                          for flag_id in ('1', '2', '3'))
+
+
 def get_manga_target(flag_id, bitmasks, header):
     """Get MANGA_TARGET[``flag_id``] flag.
 
@@ -64,12 +70,11 @@ def get_manga_target(flag_id, bitmasks, header):
         `Maskbit`
     """
     flag_id = str(int(flag_id))
-    manga_target = bitmasks['MANGA_TARGET{}'.format(flag_id)]
+    # Copies the Maskbit so that setting the mask does not modify the shared datamodel one.
+    manga_target = copy.copy(bitmasks['MANGA_TARGET{}'.format(flag_id)])
 
-    try:
-        manga_target.mask = int(header['MNGTRG{}'.format(flag_id)])
-    except KeyError:
-        manga_target.mask = int(header['MNGTARG{}'.format(flag_id)])
+    key, alt_key = _manga_target_keys[flag_id]
+    manga_target.mask = int(header[key] if key in header else header[alt_key])
 
     return manga_target
 
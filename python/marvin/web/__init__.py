@@ -5,9 +5,11 @@ Licensed under a 3-clause BSD license.
 '''
 
 from __future__ import print_function, division
+import errno
 import os
+import jinja2
 # Flask imports
-from flask import Flask, Blueprint, send_from_directory, request
+from flask import Flask, Blueprint, send_from_directory
 import flask_jsglue as jsg
 # Marvin imports
 from brain.utils.general.general import getDbMachine
@@ -25,7 +27,6 @@ from marvin.web.controllers.plate import plate
 from marvin.web.controllers.images import images
 from marvin.web.controllers.users import users
 # API Views
-from marvin.api.base import BaseView
 from marvin.api.cube import CubeView
 from marvin.api.maps import MapsView
 from marvin.api.modelcube import ModelCubeView
@@ -101,6 +102,7 @@ def create_app(debug=False, local=False, object_config=None):
     # ----------------------------------
     # Registration
     register_extensions(app, app_base=marvin_base)
+    register_jinja(app)
     register_api(app, api)
     register_blueprints(app, url_prefix=url_prefix)
 
@@ -159,6 +161,31 @@ def register_extensions(app, app_base=None):
     jwt.init_app(app)
 
 
+def register_jinja(app):
+    ''' Configure the Jinja2 environment used to render the templates '''
+
+    # Persist compiled template bytecode so new workers skip re-parsing the templates
+    cache_dir = app.config.get('JINJA_CACHE_DIR', None)
+    if cache_dir:
+        try:
+            os.makedirs(cache_dir, 0o700)
+        except OSError as e:
+            # another worker may have created it first
+            if e.errno != errno.EEXIST or not os.path.isdir(cache_dir):
+                app.logger.warning('Could not create Jinja2 cache directory {0}: {1}'.format(cache_dir, e))
+                return
+
+        if not os.access(cache_dir, os.W_OK):
+            app.logger.warning('Jinja2 cache directory {0} is not writable'.format(cache_dir))
+            return
+
+    try:
+        app.jinja_env.bytecode_cache = jinja2.FileSystemBytecodeCache(
+            directory=cache_dir, pattern='__jinja2_%s.cache')
+    except RuntimeError as e:
+        app.logger.warning('Could not set up the Jinja2 bytecode cache: {0}'.format(e))
+
+
 def register_blueprints(app, url_prefix=None):
     ''' Register the Flask Blueprints used '''
 
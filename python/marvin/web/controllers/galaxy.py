@@ -339,10 +339,13 @@ class Galaxy(BaseWebView):
                 self.galaxy['cube'] = cube
                 self.galaxy['toggleon'] = current_session.get('toggleon', 'false')
                 self.galaxy['cubehdr'] = cube.header
-                self.galaxy['quality'] = ('DRP3QUAL', cube.quality_flag.mask, cube.quality_flag.labels)
-                self.galaxy['mngtarget'] = {'bits': [it.mask for it in cube.target_flags if it.mask != 0],
-                                            'labels': [it.labels for it in cube.target_flags if len(it.labels) > 0],
-                                            'names': [''.join(('MNGTARG', it.name[-1])) for it in cube.target_flags if it.mask != 0]}
+                # decode the flags once; each property access rebuilds the bitmask
+                quality_flag = cube.quality_flag
+                self.galaxy['quality'] = ('DRP3QUAL', quality_flag.mask, quality_flag.labels)
+                target_flags = [(it, it.labels) for it in cube.target_flags]
+                self.galaxy['mngtarget'] = {'bits': [it.mask for it, labels in target_flags if it.mask != 0],
+                                            'labels': [labels for it, labels in target_flags if len(labels) > 0],
+                                            'names': [''.join(('MNGTARG', it.name[-1])) for it, labels in target_flags if it.mask != 0]}
 
                 # make the nsa dictionary
                 hasnsa = cube.nsa is not None
@@ -350,8 +353,11 @@ class Galaxy(BaseWebView):
                 if hasnsa:
                     cols = self.galaxy.get('nsaplotcols')
                     nsadict, nsacols = make_nsa_dict(cube.nsa)
-                    nsatmp = [nsacols.pop(nsacols.index(i)) for i in cols if i in nsacols]
-                    nsatmp.extend(nsacols)
+                    # plot columns first, then the rest in their original order
+                    nsaset = set(nsacols)
+                    plotcols = [i for i in cols if i in nsaset]
+                    plotset = set(plotcols)
+                    nsatmp = plotcols + [i for i in nsacols if i not in plotset]
                     self.galaxy['nsacols'] = nsatmp
                     self.galaxy['nsadict'] = nsadict
 
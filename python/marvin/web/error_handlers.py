@@ -22,7 +22,7 @@ def make_error_json(error, name, code, data=None):
     ''' creates the error json dictionary for API errors '''
     shortname = name.lower().replace(' ', '_')
     messages = {'error': shortname,
-                'message': error.description if hasattr(error, 'description') else None,
+                'message': getattr(error, 'description', None),
                 'status_code': code,
                 'traceback': get_traceback(asstring=True)}
     if data:
@@ -41,7 +41,7 @@ def make_error_page(app, name, code, sentry=None, data=None, exception=None):
     error['data'] = data
     error['name'] = name
     error['code'] = code
-    error['message'] = exception.description if exception and hasattr(exception, 'description') else None
+    error['message'] = getattr(exception, 'description', None)
     if app.config['USE_SENTRY'] and sentry:
         error['public_dsn'] = sentry.client.get_public_dsn('https')
     app.logger.error('{0} Exception {1}'.format(name, error))
@@ -57,71 +57,51 @@ def _is_api(request):
     return request.blueprint == 'api' or 'api' in request.url
 
 
+def _handle_error(error, name, code, data=None):
+    ''' Returns the API error json or the web error page, depending on the request '''
+    if _is_api(request):
+        return make_error_json(error, name, code, data=data)
+    return make_error_page(app, name, code, sentry=sentry, data=data, exception=error)
+
+
 @errors.app_errorhandler(404)
 def page_not_found(error):
-    name = 'Page Not Found'
-    if _is_api(request):
-        return make_error_json(error, name, 404)
-    else:
-        return make_error_page(app, name, 404, sentry=sentry, exception=error)
+    return _handle_error(error, 'Page Not Found', 404)
 
 
 @errors.app_errorhandler(500)
 def internal_server_error(error):
-    name = 'Internal Server Error'
-    if _is_api(request):
-        return make_error_json(error, name, 500)
-    else:
-        return make_error_page(app, name, 500, sentry=sentry, exception=error)
+    return _handle_error(error, 'Internal Server Error', 500)
 
 
 @errors.app_errorhandler(400)
 def bad_request(error):
-    name = 'Bad Request'
-    if _is_api(request):
-        return make_error_json(error, name, 400)
-    else:
-        return make_error_page(app, name, 400, sentry=sentry, exception=error)
+    return _handle_error(error, 'Bad Request', 400)
 
 
 @errors.app_errorhandler(405)
 def method_not_allowed(error):
-    name = 'Method Not Allowed'
-    if _is_api(request):
-        return make_error_json(error, name, 405)
-    else:
-        return make_error_page(app, name, 405, sentry=sentry, exception=error)
+    return _handle_error(error, 'Method Not Allowed', 405)
 
 
 @errors.app_errorhandler(422)
 def handle_unprocessable_entity(error):
     name = 'Unprocessable Entity'
-    data = getattr(error, 'data')
+    data = getattr(error, 'data', None)
     if data:
         # Get validations from the ValidationError object
         messages = data['messages']
     else:
         messages = ['Invalid request']
 
-    if _is_api(request):
-        return make_error_json(error, name, 422, data=messages)
-    else:
-        return make_error_page(app, name, 422, sentry=sentry, data=messages, exception=error)
+    return _handle_error(error, name, 422, data=messages)
 
 
 @errors.app_errorhandler(429)
 def rate_limit_exceeded(error):
-    name = 'Rate Limit Exceeded'
-    if _is_api(request):
-        return make_error_json(error, name, 429)
-    else:
-        return make_error_page(app, name, 429, sentry=sentry, exception=error)
+    return _handle_error(error, 'Rate Limit Exceeded', 429)
 
 
 @errors.app_errorhandler(504)
 def gateway_timeout(error):
-    name = 'Gateway Timeout'
-    if _is_api(request):
-        return make_error_json(error, name, 504)
-    else:
-        return make_error_page(app, name, 504, sentry=sentry, exception=error)
+    return _handle_error(error, 'Gateway Timeout', 504)
@@ -12,7 +12,6 @@ from __future__ import print_function
 from __future__ import division
 import numpy as np
 import flask
-import jinja2
 
 
 # If the filter is to return HTML code and you don't want it autmatically
@@ -22,39 +21,44 @@ jinjablue = flask.Blueprint('jinja_filters', __name__)
 
 # Ref: http://stackoverflow.com/questions/12288454/how-to-import-custom-jinja2-filters-from-another-file-and-using-flask
 
+# Display labels for the galaxy identifier types
+_GALAXY_ID_LABELS = {'plateifu': 'Plate-IFU', 'mangaid': 'MaNGA-ID'}
+
+# Display labels for the NSA colour columns
+_NSA_LABELS = {'elpetro_absmag_g_r': 'Abs. g-r',
+               'elpetro_absmag_u_r': 'Abs. u-r',
+               'elpetro_absmag_i_z': 'Abs. i-z'}
+
+# MaNGA target type for each MNGTARG flag number
+_TARGET_TYPES = {'1': 'Galaxy', '2': 'Stellar', '3': 'Ancillary'}
+
+# Alert class and text for each quality state
+_QA_STATES = {'good': ('success', 'Good'),
+              'critical': ('danger', 'DO NOT USE'),
+              'warning': ('warning', 'Warning')}
+
 
-@jinja2.contextfilter
 @jinjablue.app_template_filter()
-def make_token(context, value, group):
+def make_token(value, group):
     ''' Make a keyword string for query parameter dropdown live search '''
     tokstring = ', '.join([group, value._joinedname])
     return tokstring
 
 
-@jinja2.contextfilter
 @jinjablue.app_template_filter()
-def filtergaltype(context, value):
+def filtergaltype(value):
     ''' Parse plateifu or mangaid into better form '''
-    if value == 'plateifu':
-        return 'Plate-IFU'
-    elif value == 'mangaid':
-        return 'MaNGA-ID'
+    return _GALAXY_ID_LABELS.get(value, value)
 
 
-@jinja2.contextfilter
 @jinjablue.app_template_filter()
-def filternsa(context, value):
+def filternsa(value):
     ''' Parse plateifu or mangaid into better form '''
-
-    newvalue = value.replace('elpetro_absmag_g_r', 'Abs. g-r').\
-        replace('elpetro_absmag_u_r', 'Abs. u-r').\
-        replace('elpetro_absmag_i_z', 'Abs. i-z')
-    return newvalue
+    return _NSA_LABELS.get(value, value)
 
 
-@jinja2.contextfilter
 @jinjablue.app_template_filter()
-def filternsaval(context, value, key):
+def filternsaval(value, key):
     ''' Parse plateifu or mangaid into better form '''
 
     if type(value) == list:
@@ -67,9 +71,8 @@ def filternsaval(context, value, key):
     return newvalue
 
 
-@jinja2.contextfilter
 @jinjablue.app_template_filter()
-def allclose(context, value, newvalue):
+def allclose(value, newvalue):
     ''' Do a numpy allclose comparison between the two values '''
     try:
         return np.allclose(float(value), float(newvalue), 1e-7)
@@ -77,41 +80,32 @@ def allclose(context, value, newvalue):
         return False
 
 
-@jinja2.contextfilter
 @jinjablue.app_template_filter()
-def prettyFlag(context, value):
+def prettyFlag(value):
     ''' Pretty print bit mask and flags '''
     name, bit, flags = value
     return '{0}: {1} - {2}'.format(name, bit, ', '.join(flags))
 
 
-@jinja2.contextfilter
 @jinjablue.app_template_filter()
-def qaclass(context, value):
+def qaclass(value):
     ''' Return an alert indicator based on quality flags '''
     name, bit, flags = value
-    isgood = ['VALIDFILE'] == flags or [] == flags
-    iscrit = 'CRITICAL' in flags
-    out = 'success' if isgood else 'danger' if iscrit else 'warning'
-    text = 'Good' if isgood else 'DO NOT USE' if iscrit else 'Warning'
-    return out, text
+    state = 'good' if flags in ([], ['VALIDFILE']) else 'critical' if 'CRITICAL' in flags else 'warning'
+    return _QA_STATES[state]
 
 
-@jinja2.contextfilter
 @jinjablue.app_template_filter()
-def targtype(context, value):
+def targtype(value):
     ''' Return the MaNGA target type based on what bit is set '''
     # names = value.get('names', None)
     # namelabel = ', '.join(names)
     # out = namelabel.replace('MNGTRG1', 'Galaxy').replace('MNGTRG2', 'Stellar').replace('MNGTRG3', 'Ancillary')
-    out = 'Galaxy' if '1' in value else 'Ancillary' if '3' in value else 'Stellar'
-    return out
+    # value is the flag name, e.g. mngtarg1; the trailing digit picks the target type
+    return _TARGET_TYPES.get(value[-1:], 'Stellar')
 
 
-@jinja2.contextfilter
 @jinjablue.app_template_filter()
-def split(context, value, delim=None):
+def split(value, delim=' '):
     '''Split a string based on a delimiter'''
-    if not delim:
-        delim = ' '
     return value.split(delim) if value else None
@@ -62,6 +62,8 @@ class Config(object):
     # RATELIMIT_DEFAULT = '10/hour;100/day;2000 per year'
     RATELIMIT_STRATEGY = 'fixed-window-elastic-expiry'
     RATELIMIT_ENABLED = True
+    # Jinja2 bytecode cache directory; if not set, Jinja2 uses a private per-user temp directory
+    JINJA_CACHE_DIR = os.environ.get('MARVIN_JINJA_CACHE', None)
 
 
 class ProdConfig(Config):
@@ -76,6 +78,7 @@ class ProdConfig(Config):
     PERMANENT_SESSION_LIFETIME = datetime.timedelta(1)
     JWT_ACCESS_TOKEN_EXPIRES = datetime.timedelta(300)
     REMEMBER_COOKIE_DOMAIN = '.sdss.org'
+    TEMPLATES_AUTO_RELOAD = False  # Templates do not change in production
 
 
 class DevConfig(Config):
@@ -90,6 +93,7 @@ class DevConfig(Config):
     ASSETS_DEBUG = True  # Don't bundle/minify static assets
     CACHE_TYPE = 'simple'  # Can be "memcached", "redis", etc.
     RATELIMIT_ENABLED = False
+    TEMPLATES_AUTO_RELOAD = True  # Pick up template edits without a restart
 
 
 class TestConfig(Config):